@@ -1,9 +1,29 @@
-from comrade.core import Bot
+import asyncio
+import sys
+
+from comrade.core import Bot, compile_config
 
 import logging
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logging.basicConfig(level=logging.INFO)
 
 
-bot = Bot(config_file="comrade.toml")
-bot.run()
+if sys.argv[1:] == ["compile-config"]:
+    compile_config("comrade.toml")
+else:
+    # discord.py grabs the event loop when the Bot is constructed, so uvloop has to
+    # be set up before then, rather than in Bot.run. The uvloop policy won't create
+    # a loop for us on demand, so we create it ourselves and make it current.
+    if uvloop is not None:
+        loop = uvloop.new_event_loop()
+    else:
+        loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    bot = Bot(config_file="comrade.toml", loop=loop)
+    bot.run()
@@ -1,38 +1,98 @@
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import json
+import os
+import pathlib
+import pickle
+import tempfile
 import typing
 
 import attr
 import cattr
 import grpc
-import toml
 
+from cattr.gen import make_dict_structure_fn
 from discord.ext.commands import Bot as _Bot
 from discord_slash import SlashCommand
 from grpc_reflection.v1alpha import reflection
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy import exc, sql
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from comrade import db
 
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
 
-EXTENSIONS = [".core", ".dkp"]
 
+EXTENSIONS = ("comrade.plugins.core", "comrade.plugins.dkp")
 
+
+# Where we record what slash commands we last synced to Discord, so that we only sync
+# them again when they've changed.
+COMMANDS_CACHE_DIR = pathlib.Path.home() / ".cache" / "comrade" / "commands"
+
+
+RPC_SERVER_OPTIONS = (
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.max_concurrent_streams", 100),
+)
+
+
+# Structured configs that we've already loaded, keyed by the resolved path to the
+# config file along with its mtime and size, so that constructing multiple bots from
+# an unchanged file doesn't parse and structure it again.
+_CONFIG_CACHE: dict[tuple[str, int, int], "Config"] = {}
+
+
+# Engines that have been created for a given event loop, database URL, and pool
+# options, so that multiple bots in the same process pointed at the same database
+# share one pool. Pooled connections belong to the loop that opened them, so bots
+# running on different loops can't share an engine.
+#
+# Each engine keeps a count of the bots using it, and is only disposed of once the
+# last of them has closed.
 @attr.s(slots=True, auto_attribs=True)
+class _CachedEngine:
+
+    engine: AsyncEngine
+    refs: int = 0
+
+
+_ENGINE_CACHE: dict[tuple, _CachedEngine] = {}
+
+
+# The async drivers to use for database URLs that don't name a driver, since
+# SQLAlchemy would otherwise pick a synchronous one that can't be used with asyncio.
+_ASYNC_DRIVERS = {
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
 class Listener:
 
     bind: str
-    tls_certificate: typing.Optional[str] = None
-    tls_certificate_key: typing.Optional[str] = None
-    tls_trusted_certificates: typing.Optional[str] = None
+    tls_certificate: str | None = None
+    tls_certificate_key: str | None = None
+    tls_trusted_certificates: str | None = None
     require_client_auth: bool = False
 
 
-@attr.s(slots=True, auto_attribs=True)
+@attr.s(slots=True, frozen=True, auto_attribs=True)
 class RPC:
 
-    listeners: typing.List[Listener] = attr.ib(factory=list)
+    listeners: tuple[Listener, ...] = ()
 
 
-@attr.s(slots=True, auto_attribs=True)
+@attr.s(slots=True, frozen=True, auto_attribs=True)
 class DKP:
 
     url: str
@@ -40,14 +100,14 @@ class DKP:
     dkp_pool_id: int
 
 
-@attr.s(slots=True, auto_attribs=True)
+@attr.s(slots=True, frozen=True, auto_attribs=True)
 class Discord:
 
     token: str
     server_id: int
 
 
-@attr.s(slots=True, auto_attribs=True)
+@attr.s(slots=True, frozen=True, auto_attribs=True)
 class AuctionRoles:
 
     officer: str
@@ -56,7 +116,7 @@ class AuctionRoles:
     member: str
 
 
-@attr.s(slots=True, auto_attribs=True)
+@attr.s(slots=True, frozen=True, auto_attribs=True)
 class AuctionLimits:
 
     valuable: int
@@ -65,72 +125,358 @@ class AuctionLimits:
     maximum: int
 
 
-@attr.s(slots=True, auto_attribs=True)
+@attr.s(slots=True, frozen=True, auto_attribs=True)
 class Auction:
 
     roles: AuctionRoles
     limits: AuctionLimits
-    channels: list[str] = attr.ib(factory=list)
-
-
-@attr.s(slots=True, auto_attribs=True)
+    channels: tuple[str, ...] = ()
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class DatabasePool:
+
+    # Any of these that are left unset will use SQLAlchemy's default for the pool
+    # that it selects for our database.
+    pool_size: int | None = None
+    max_overflow: int | None = None
+    pool_pre_ping: bool | None = None
+    pool_recycle: int | None = None
+
+    # The number of connections to open when the bot starts, so that they're already
+    # sitting in the pool by the time we need them.
+    min_size: int = attr.ib(default=0)
+
+    @min_size.validator
+    def _check_min_size(self, attribute, value):
+        # We open all of these connections at once, so if there are more of them than
+        # the pool will hand out, we'd just sit there until the pool times out. Any
+        # limits we weren't given fall back to SQLAlchemy's QueuePool defaults, and
+        # a negative max_overflow means there's no limit at all.
+        pool_size = 5 if self.pool_size is None else self.pool_size
+        max_overflow = 10 if self.max_overflow is None else self.max_overflow
+        if value < 0:
+            raise ValueError("database_pool.min_size must not be negative")
+        if max_overflow >= 0 and value > pool_size + max_overflow:
+            raise ValueError(
+                f"database_pool.min_size ({value}) must not be larger than "
+                f"pool_size + max_overflow ({pool_size + max_overflow})"
+            )
+
+    def engine_options(self) -> dict[str, typing.Any]:
+        options = attr.asdict(self, filter=lambda a, v: v is not None)
+        del options["min_size"]
+        return options
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
 class Config:
 
     database: str
     discord: Discord
     dkp: DKP
     auction: Auction
+    database_pool: DatabasePool = attr.ib(factory=DatabasePool)
     rpc: RPC = attr.ib(factory=RPC)
 
 
-class Bot(_Bot):
-    def __init__(self, command_prefix="!", *args, config_file, **kwargs):
-        super().__init__(command_prefix, *args, **kwargs)
+_CONFIG_CLASSES = [
+    Listener,
+    RPC,
+    DKP,
+    Discord,
+    AuctionRoles,
+    AuctionLimits,
+    Auction,
+    DatabasePool,
+    Config,
+]
+
+
+# A converter with structure functions generated specifically for each of our config
+# classes, rather than having cattrs work out how to structure them on every call.
+_converter = cattr.Converter()
+for _cls in _CONFIG_CLASSES:
+    _converter.register_structure_hook(_cls, make_dict_structure_fn(_cls, _converter))
+
+
+@functools.lru_cache(maxsize=None)
+def _read_file(path: str, mtime_ns: int) -> bytes:
+    with open(path, "rb") as fp:
+        return fp.read()
+
+
+def _read_pem(path: str | None) -> bytes | None:
+    # Listeners will often share certificates, so we only read each one once, unless
+    # it has changed since we last read it.
+    if path is None:
+        return None
+
+    path = os.path.realpath(path)
+    return _read_file(path, os.stat(path).st_mtime_ns)
+
+
+def async_database_url(database: str) -> URL:
+    url = make_url(database)
+    if url.drivername in _ASYNC_DRIVERS:
+        url = url.set(drivername=_ASYNC_DRIVERS[url.drivername])
+
+    # asyncpg prepares every statement we execute, so give it a larger cache of
+    # prepared statements to reuse than the default, unless one was configured.
+    if (
+        url.drivername == "postgresql+asyncpg"
+        and "prepared_statement_cache_size" not in url.query
+    ):
+        url = url.update_query_dict({"prepared_statement_cache_size": "1024"})
+
+    return url
 
-        self._slash = SlashCommand(self, sync_commands=True)
 
-        with open(config_file) as fp:
-            self.config: Config = cattr.structure(toml.load(fp), Config)
+def _config_schema() -> tuple:
+    # A description of the shape of our config classes, stored alongside a compiled
+    # config so that we don't load a compiled config that was pickled from an older
+    # (or newer) version of these classes.
+    return tuple(
+        (cls.__name__, tuple((a.name, repr(a.type)) for a in attr.fields(cls)))
+        for cls in _CONFIG_CLASSES
+    )
 
-        self.db = create_async_engine(self.config.database)
 
-        self.rpc = grpc.aio.server()
-        self._rpc_services = []
+def _compiled_config_file(config_file) -> str:
+    return f"{config_file}.cache"
+
+
+def _structure_config(data: bytes) -> Config:
+    return _converter.structure(tomllib.loads(data.decode("utf-8")), Config)
+
+
+def _load_compiled_config(config_file, digest: bytes) -> Config | None:
+    # A compiled config is purely an optimization, so if it's missing, stale, or we
+    # can't load it for any reason, we'll just fall back to parsing the config.
+    try:
+        with open(_compiled_config_file(config_file), "rb") as fp:
+            header, config = pickle.load(fp)
+    except Exception:
+        return None
+
+    if header != (digest, _config_schema()):
+        return None
+
+    return config
+
+
+def compile_config(config_file) -> None:
+    with open(config_file, "rb", buffering=0) as fp:
+        data = fp.read()
+        mode = os.fstat(fp.fileno()).st_mode & 0o777
+
+    header = (hashlib.blake2b(data).digest(), _config_schema())
+    compiled = (header, _structure_config(data))
+
+    # The compiled config holds all of our secrets, just like the config itself, so
+    # it gets the same permissions as the config. We write it to a temporary file
+    # and move it into place, so that we never leave a partially written one behind.
+    compiled_file = _compiled_config_file(config_file)
+    fd, tmp_file = tempfile.mkstemp(
+        dir=os.path.dirname(compiled_file) or ".",
+        prefix=f".{os.path.basename(compiled_file)}.",
+    )
+    try:
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, "wb") as fp:
+            pickle.dump(compiled, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, compiled_file)
+    except BaseException:
+        os.unlink(tmp_file)
+        raise
+
+
+def load_config(config_file) -> Config:
+    st = os.stat(config_file)
+    key = (os.path.realpath(config_file), st.st_mtime_ns, st.st_size)
+
+    if key not in _CONFIG_CACHE:
+        # We always need the entire file, so read it in a single unbuffered call
+        # rather than going through a file buffer.
+        with open(config_file, "rb", buffering=0) as fp:
+            data = fp.read()
+
+        # If the config has been compiled with compile_config, and the source hasn't
+        # changed since then, we can skip parsing and structuring it entirely.
+        config = _load_compiled_config(config_file, hashlib.blake2b(data).digest())
+        if config is None:
+            config = _structure_config(data)
+
+        _CONFIG_CACHE[key] = config
+
+    return _CONFIG_CACHE[key]
+
+
+class Bot(_Bot):
+    def __init__(self, command_prefix="!", *args, config_file, **kwargs):
+        super().__init__(command_prefix, *args, **kwargs)
+
+        self._slash = SlashCommand(self)
+
+        self.config: Config = load_config(config_file)
+
+        database_url = async_database_url(self.config.database)
+        engine_options = self.config.database_pool.engine_options()
+        self._db_key = (
+            self.loop,
+            database_url,
+            tuple(sorted(engine_options.items())),
+        )
+        if self._db_key not in _ENGINE_CACHE:
+            _ENGINE_CACHE[self._db_key] = _CachedEngine(
+                create_async_engine(database_url, **engine_options)
+            )
+        cached = _ENGINE_CACHE[self._db_key]
+        cached.refs += 1
+        self.db = cached.engine
+        self._db_released = False
+
+        # All of our servicers are async, so the server only needs a token thread pool
+        # rather than the default one sized to the number of CPUs.
+        self._rpc_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self.rpc = grpc.aio.server(
+            migration_thread_pool=self._rpc_pool, options=RPC_SERVER_OPTIONS
+        )
+        self._pending_rpc = []
 
         for listener in self.config.rpc.listeners:
-            if all([listener.tls_certificate, listener.tls_certificate_key]):
-                grpc.ssl_server_credentials(
-                    [(listener.tls_certificate_key, listener.tls_certificate)],
-                    root_certificates=listener.tls_trusted_certificates,
+            if listener.tls_certificate and listener.tls_certificate_key:
+                credentials = grpc.ssl_server_credentials(
+                    [
+                        (
+                            _read_pem(listener.tls_certificate_key),
+                            _read_pem(listener.tls_certificate),
+                        )
+                    ],
+                    root_certificates=_read_pem(listener.tls_trusted_certificates),
                     require_client_auth=listener.require_client_auth,
                 )
-                self.rpc.add_secure_port(listener.bind, None)
+                self.rpc.add_secure_port(listener.bind, credentials)
             else:
                 self.rpc.add_insecure_port(listener.bind)
 
         for ext in EXTENSIONS:
-            self.load_extension(ext, package="comrade.plugins")
+            self.load_extension(ext)
+
+        self.loop.create_task(self._sync_commands())
+
+    async def _sync_commands(self):
+        # Syncing has to fetch every command that Discord has registered for us, which
+        # makes startup slow, so we skip it unless our commands have changed since the
+        # last time that we synced them.
+        commands = await self._slash.to_dict()
+        digest = hashlib.blake2b(
+            json.dumps(commands, default=str, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+        cache_file = COMMANDS_CACHE_DIR / str(self.user.id)
+        try:
+            if cache_file.read_text() == digest:
+                return
+        except FileNotFoundError:
+            pass
+
+        await self._slash.sync_all_commands()
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(digest)
 
     def add_rpc(self, servicer, name, register_cb):
-        self._rpc_services.append(name)
-        register_cb(servicer, self.rpc)
+        # Services aren't added to the server until we start, so that we can register
+        # all of them, and reflection for them, in one go.
+        self._pending_rpc.append((servicer, name, register_cb))
 
     def run(self, token=None, *args, **kwargs):
-        reflection.enable_server_reflection(self._rpc_services, self.rpc)
-
         if token is None:
             token = self.config.discord.token
 
         return super().run(token, *args, **kwargs)
 
     async def start(self, *args, **kwargs):
+        names = []
+        for servicer, name, register_cb in self._pending_rpc:
+            register_cb(servicer, self.rpc)
+            names.append(name)
+        self._pending_rpc.clear()
+
+        reflection.enable_server_reflection(names, self.rpc)
+
         await self.rpc.start()
+        await self._warm_db_pool()
         return await super().start(*args, **kwargs)
 
+    async def _warm_db_pool(self):
+        # Opening a connection, and then closing it, returns it to the pool so that
+        # it's ready for the first thing that actually needs it.
+        count = self.config.database_pool.min_size
+        if count:
+            results = await asyncio.gather(
+                *(self.db.connect() for _ in range(count)), return_exceptions=True
+            )
+
+            # Even if some of the connections failed, we still need to give back the
+            # ones that didn't before we report the failure.
+            conns = [r for r in results if not isinstance(r, BaseException)]
+            await asyncio.gather(*(conn.close() for conn in conns))
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
     async def close(self, *args, **kwargs):
         await self.rpc.stop(10)
+        self._rpc_pool.shutdown(wait=False)
+
+        # Cogs only get a synchronous hook when they're unloaded, so any cog that has
+        # async resources to clean up gets a chance to do so here, while the loop is
+        # still running.
+        for cog in tuple(self.cogs.values()):
+            close = getattr(cog, "close", None)
+            if close is not None:
+                await close()
+
+        # The engine might be shared with other bots, so we only dispose of it once
+        # we were the last one using it. close() can be called more than once, so we
+        # make sure that we only give up our reference the first time.
+        if not self._db_released:
+            self._db_released = True
+            cached = _ENGINE_CACHE[self._db_key]
+            cached.refs -= 1
+            if not cached.refs:
+                del _ENGINE_CACHE[self._db_key]
+                await cached.engine.dispose()
+
         return await super().close(*args, **kwargs)
 
+    async def _schema_version(self) -> str | None:
+        try:
+            async with self.db.connect() as conn:
+                return await conn.scalar(
+                    sql.select(db.schema_meta.c.value).where(
+                        db.schema_meta.c.key == "version"
+                    )
+                )
+        except (exc.OperationalError, exc.ProgrammingError):
+            # The schema_meta table doesn't exist, so this is our first run.
+            return None
+
     async def on_ready(self):
+        # Creating the tables has to check whether each one already exists, so we skip
+        # it entirely if the schema has already been created at our current version.
+        if await self._schema_version() == db.SCHEMA_VERSION:
+            return
+
         async with self.db.begin() as conn:
             await conn.run_sync(db.metadata.create_all)
+            await conn.execute(
+                sql.delete(db.schema_meta).where(db.schema_meta.c.key == "version")
+            )
+            await conn.execute(
+                sql.insert(db.schema_meta).values(
+                    key="version", value=db.SCHEMA_VERSION
+                )
+            )
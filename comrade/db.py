@@ -1,4 +1,18 @@
-from sqlalchemy import MetaData
+from sqlalchemy import Column, MetaData, String, Table
 
 
 metadata = MetaData()
+
+
+# This needs to be bumped whenever a table is added or changed, otherwise the bot
+# will assume that the schema is already up to date and won't create it.
+SCHEMA_VERSION = "1"
+
+
+schema_meta = Table(
+    "schema_meta",
+    metadata,
+    Column("key", String(100), primary_key=True),
+    Column("value", String(100), nullable=False),
+    extend_existing=True,
+)
@@ -1,7 +1,10 @@
+import asyncio
+import collections
 import enum
 import datetime
 import itertools
 import logging
+import operator
 import random
 import typing
 import functools
@@ -25,11 +28,35 @@ from .provider import CharacterDKP
 logger = logging.getLogger(__name__)
 
 
+# These are used on every tick for every running auction, so we build them once
+# rather than every time we need them.
+_utcnow = datetime.datetime.utcnow
+_TD_0 = datetime.timedelta(seconds=0)
+_TD_10 = datetime.timedelta(seconds=10)
+_TD_15 = datetime.timedelta(seconds=15)
+_TD_30 = datetime.timedelta(seconds=30)
+_TD_90 = datetime.timedelta(seconds=90)
+
+
+@functools.lru_cache(maxsize=256)
+def _humanize_seconds(seconds: int) -> str:
+    return humanize.precisedelta(datetime.timedelta(seconds=seconds), format="%0.0f")
+
+
 def humanize_delta(td: datetime.timedelta) -> str:
-    return humanize.precisedelta(td, format="%0.0f")
+    # We only ever display whole seconds, so we round to the nearest one and can then
+    # reuse the (relatively expensive) formatting for any delta we've seen before.
+    return _humanize_seconds(round(td.total_seconds()))
 
 
-async def smart_send(ctx, hidden=False, **kwargs):
+async def defer_hidden(ctx):
+    # Deferring an interaction that has already been deferred or responded to raises
+    # an error, so we only defer when nothing has been sent for it yet.
+    if not (ctx.deferred or ctx.responded):
+        await ctx.defer(hidden=True)
+
+
+async def send_messages(ctx, messages: Iterable["AuctionMessage"]):
     # There's an issue (it might be with the library or the API, not sure which)
     # where if you defer a command with a hidden response, you can't then later
     # respond with a public response without first giving a private response.
@@ -38,19 +65,31 @@ async def smart_send(ctx, hidden=False, **kwargs):
     # UI where it tries to load the original message and you get either told it
     # was deleted OR it couldn't be loaded.
     #
-    # To solve all of this, our smart_send function will send private responses
-    # as responses to the command handler, but public responses will just be sent
-    # directly to the channel.
+    # To solve all of this, we send private responses as responses to the command
+    # handler, but public responses will just be sent directly to the channel.
     #
-    # This only really needs to be used in situations where a command might send
-    # a mixture of response types (hidden and public) after a ctx.defer.
-    if hidden:
-        await ctx.send(hidden=True, **kwargs)
-    else:
-        await ctx.channel.send(**kwargs)
+    # Since the two go to different places, they don't have any ordering between
+    # each other that matters. We send each kind in order, but send both kinds at the
+    # same time so that a command's latency isn't the sum of every message it sends.
+    hidden, public = [], []
+    for message in messages:
+        (hidden if message.hidden else public).append(message.as_kwargs())
 
+    async def _send_hidden():
+        for kwargs in hidden:
+            await ctx.send(hidden=True, **kwargs)
 
-@attr.s(slots=True, frozen=True, auto_attribs=True)
+    # ctx.channel looks the channel up on the bot every time it's accessed, so we only
+    # resolve it once.
+    async def _send_public():
+        channel = ctx.channel
+        for kwargs in public:
+            await channel.send(**kwargs)
+
+    await asyncio.gather(_send_hidden(), _send_public())
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True, cache_hash=True)
 class AuctionItem:
 
     item: str
@@ -84,7 +123,7 @@ class BidderRank(enum.Enum):
     Member = enum.auto()
 
 
-@attr.s(slots=True, frozen=True, auto_attribs=True)
+@attr.s(slots=True, frozen=True, auto_attribs=True, cache_hash=True)
 class Bid:
 
     bidder: str
@@ -106,15 +145,19 @@ class RunningAuction:
 
     item: AuctionItem
     status: Status = Status.Running
-    started_at: datetime.datetime = attr.ib(factory=datetime.datetime.utcnow)
+    started_at: datetime.datetime = attr.ib(factory=_utcnow)
     last_bid: typing.Optional[datetime.datetime] = None
     last_updated: typing.Optional[datetime.datetime] = None
-    bids: set[Bid] = attr.ib(factory=set)
+    # Each bidder has a single standing bid for each of their bid ids.
+    bids: dict[tuple[str, int], Bid] = attr.ib(factory=dict)
+    bid_amounts: set[int] = attr.ib(factory=set)
     results: typing.Optional[AuctionResults] = None
+    results_fingerprint: typing.Optional[tuple] = None
+    results_text: typing.Optional[str] = None
 
     @property
     def time_left(self) -> datetime.timedelta:
-        now = datetime.datetime.utcnow()
+        now = _utcnow()
 
         # The logic here is kind of convulted, but it's basically inteded to roughly
         # encode the following rules:
@@ -130,13 +173,13 @@ class RunningAuction:
         # know that it will be AT LEAST this amount of time, which is close enough.
 
         # We'll start with the 90s minimum.
-        end = self.started_at + datetime.timedelta(seconds=90)
+        end = self.started_at + _TD_90
 
         # Next we'll check to see what our end time is bsed off the last bid, if
         # we've had any bids, if that's further in the future then our default, then
         # that becomes our new end.
         if self.last_bid is not None:
-            bid_end = self.last_bid + datetime.timedelta(seconds=30)
+            bid_end = self.last_bid + _TD_30
             if bid_end > end:
                 end = bid_end
 
@@ -148,7 +191,7 @@ class RunningAuction:
         if self.last_updated is not None and (
             self.last_bid is None or self.last_updated > self.last_bid
         ):
-            updated_end = self.last_updated + datetime.timedelta(seconds=15)
+            updated_end = self.last_updated + _TD_15
             if updated_end > end:
                 end = updated_end
 
@@ -160,7 +203,7 @@ class RunningAuction:
         if self.last_updated is None or (
             self.last_bid is not None and self.last_updated < self.last_bid
         ):
-            updated_end = now + datetime.timedelta(seconds=15)
+            updated_end = now + _TD_15
             if updated_end > end:
                 end = updated_end
 
@@ -170,7 +213,12 @@ class RunningAuction:
         if end > now:
             return end - now
         else:
-            return datetime.timedelta(seconds=0)
+            return _TD_0
+
+    def summary(self) -> tuple[str, str]:
+        # The description of the item, and how long is left, which is what most of our
+        # messages about an auction need, computed once for each message.
+        return (self.item.description, humanize_delta(self.time_left))
 
     @property
     def needs_update(self) -> bool:
@@ -183,38 +231,39 @@ class RunningAuction:
         # 1. If the auction started > 30s ago
         # 2. If the last bid was > 10s ago
         # 3. If the last update was > 30s ago
-        now = datetime.datetime.utcnow()
-        if (
-            (now - self.started_at).total_seconds() > 30
-            and (self.last_bid is None or (now - self.last_bid).total_seconds() > 10)
-            and (
-                self.last_updated is None
-                or (now - self.last_updated).total_seconds() > 30
-            )
-        ):
-            return True
+        #
+        # We compare the timedeltas directly, rather than converting them to seconds,
+        # and bail out as soon as any of the rules isn't met.
+        now = _utcnow()
+        if now - self.started_at <= _TD_30:
+            return False
+        if self.last_bid is not None and now - self.last_bid <= _TD_10:
+            return False
+        if self.last_updated is not None and now - self.last_updated <= _TD_30:
+            return False
 
-        return False
+        return True
 
 
 @attr.s(slots=True, frozen=True, auto_attribs=True)
 class AuctionMessage:
 
     channel: str
-    message: typing.Union[str, discord.Embed]
+    content: typing.Optional[str] = None
+    embed: typing.Optional[discord.Embed] = None
     hidden: bool = False
 
     def as_kwargs(self):
-        if isinstance(self.message, discord.Embed):
-            return {"embed": self.message}
+        if self.embed is not None:
+            return {"embed": self.embed}
         else:
-            return {"content": self.message}
+            return {"content": self.content}
 
 
 def validate_bid(
     bidder: str,
     bid_amount: int,
-    bids: Iterable[Bid],
+    bid_amounts: typing.AbstractSet[int],
     dkp: typing.Mapping[str, CharacterDKP],
     *,
     valuable_threshold: int,
@@ -241,7 +290,7 @@ def validate_bid(
         # We do nothing here, because this exists just so that we don't reject
         # an "all in" bid because it doesn't match the "divisble by 5" rules.
         pass
-    elif bid_amount in {bid.bid for bid in bids}:
+    elif bid_amount in bid_amounts:
         # Again we do nothing here, because this only exists to prevent us from
         # progressing further down the elif chain, and allowing bids that match
         # already existing bids.
@@ -273,24 +322,16 @@ def _bid_key(dkp: typing.Mapping[str, CharacterDKP], member_treshold: int):
         #     anyone else.
         #  2. When a bid is < valuable_threshold, everyone is of equal priority.
         #  3. Smaller Bids are lower priority than higher bids.
+        entry = dkp.get(bid.bidder)
         return (
             1 if bid.bid >= member_treshold and bid.rank is BidderRank.Raider else 0,
             bid.bid,
-            dkp.get(bid.bidder, CharacterDKP(name=bid.bidder)).current,
+            entry.current if entry is not None else 0,
         )
 
     return key_fn
 
 
-def _filter_bids(bids: Iterable[Bid]) -> Iterable[Bid]:
-    seen = set()
-    for bid in bids:
-        key = (bid.bidder, bid.id)
-        if key not in seen:
-            seen.add(key)
-            yield bid
-
-
 def determine_results(
     auction: RunningAuction,
     dkp: typing.Mapping[str, CharacterDKP],
@@ -305,11 +346,16 @@ def determine_results(
     tied = []
     rolled = 0
 
-    all_bids = _filter_bids(
-        sorted(auction.bids, key=_bid_key(dkp, member_treshold), reverse=True)
+    # We compute the sort key for each bid once up front, rather than having sorted
+    # and groupby each compute it again for every comparison.
+    key_fn = _bid_key(dkp, member_treshold)
+    all_bids = sorted(
+        ((key_fn(bid), bid) for bid in auction.bids.values()),
+        key=operator.itemgetter(0),
+        reverse=True,
     )
-    for _, b in itertools.groupby(all_bids, _bid_key(dkp, member_treshold)):
-        bids = list(b)
+    for _, b in itertools.groupby(all_bids, operator.itemgetter(0)):
+        bids = [bid for _, bid in b]
 
         # If the number of people at this bid+current dkp doesn't exceed the
         # number of items we have left to assign, then we can just award it to
@@ -336,6 +382,22 @@ def determine_results(
     return AuctionResults(winners=winners, tied=tied, rolled=rolled)
 
 
+def _results_fingerprint(
+    auction: RunningAuction, dkp: typing.Mapping[str, CharacterDKP]
+) -> tuple:
+    # Everything that determine_results depends on, the bids themselves and the
+    # current DKP of everyone who has bid (which is used to break ties), so that we
+    # can tell whether the results could have changed without recomputing them.
+    return (
+        frozenset(auction.bids.values()),
+        frozenset(
+            (bid.bidder, dkp[bid.bidder].current)
+            for bid in auction.bids.values()
+            if bid.bidder in dkp
+        ),
+    )
+
+
 def check_auction_channels(fn):
     @functools.wraps(fn)
     def wrapper(self, channel, *args, **kwargs):
@@ -345,7 +407,7 @@ def check_auction_channels(fn):
         if channel not in self._channels:
             yield AuctionMessage(
                 channel=channel,
-                message="This isn't an auction channel. Try Again.",
+                content="This isn't an auction channel. Try Again.",
                 hidden=True,
             )
         # Likewise, even if it is one of our channels, there might not be an active
@@ -353,7 +415,7 @@ def check_auction_channels(fn):
         elif self._channels[channel] is None:
             yield AuctionMessage(
                 channel=channel,
-                message="There isn't an active auction in this channel.",
+                content="There isn't an active auction in this channel.",
                 hidden=True,
             )
         else:
@@ -370,7 +432,7 @@ def check_auction_status(statuses):
                 if self._channels[channel].status is status:
                     yield AuctionMessage(
                         channel=channel,
-                        message=message,
+                        content=message,
                         hidden=True,
                     )
                     return
@@ -385,31 +447,64 @@ class Auctioneer:
     def __init__(self, *args, channels, limits, **kwargs):
         super().__init__(*args, *kwargs)
 
-        self._pending_items: list[AuctionItem] = []
+        self._pending_items: collections.deque[AuctionItem] = collections.deque()
         self._channels: dict[str, typing.Optional[RunningAuction]] = {
             channel: None for channel in channels
         }
+        # Which channels have an auction in them, and which don't, kept in sync with
+        # self._channels so that we don't have to scan every channel to find them. The
+        # idle channels are kept in a list, along with each channel's index in it, so
+        # that we can both pick a random one and remove it in constant time. The active
+        # channels are kept in a dict, used as an ordered set, so that we always work
+        # through them in a stable order.
+        self._active: dict[str, None] = {}
+        self._idle: list[str] = list(self._channels)
+        self._idle_index: dict[str, int] = {
+            channel: index for index, channel in enumerate(self._idle)
+        }
         self._limits = limits
         self._dkp: typing.Mapping[str, CharacterDKP] = {}
 
     @property
     def has_running_auctions(self) -> bool:
-        return any(self._channels.values())
+        return bool(self._active)
+
+    def _mark_active(self, channel: str) -> None:
+        # Move the last idle channel into the slot of the channel that we're removing,
+        # so that we never have to shift the rest of the list.
+        index = self._idle_index.pop(channel)
+        last = self._idle.pop()
+        if last != channel:
+            self._idle[index] = last
+            self._idle_index[last] = index
+
+        self._active[channel] = None
+
+    def _mark_idle(self, channel: str) -> None:
+        self._active.pop(channel, None)
+        if channel not in self._idle_index:
+            self._idle_index[channel] = len(self._idle)
+            self._idle.append(channel)
 
     def add(self, item: AuctionItem) -> None:
         self._pending_items.append(item)
 
-    def update_dkp(self, dkp):
-        self._dkp.clear()
-        self._dkp.update(dkp)
+    def update_dkp(self, dkp: typing.Mapping[str, CharacterDKP]):
+        # We hold onto the mapping we're given rather than copying it, so callers must
+        # not mutate it afterwards. The DKP provider hands back the same mapping when
+        # nothing has changed, which makes this a no-op in that case.
+        self._dkp = dkp
 
     def run(self) -> Iterable[AuctionMessage]:
         # Loop over any running auctions we have, posting updates and/or closing the
         # auction as needed.
-        for channel, auction in self._channels.items():
-            # If there's no running auction here, we can just skip this channel.
+        #
+        # We iterate over a copy, since auctions can be deleted while we're suspended.
+        for channel in list(self._active):
+            auction = self._channels[channel]
+
+            # If the auction has been deleted since we started, we can just skip it.
             if auction is None:
-                logger.debug(f"No auction for channel: {channel}, skipping.")
                 continue
 
             # If this auction is ready to be closed, then we're going to close it.
@@ -420,23 +515,29 @@ class Auctioneer:
                 auction.results = determine_results(
                     auction, self._dkp, member_treshold=self._limits.member
                 )
+                auction.results_fingerprint = _results_fingerprint(auction, self._dkp)
+                # Formatting the results walks every bid, so we do it once here and
+                # reuse it when the auction is accepted with the same results.
+                auction.results_text = str(auction.results)
                 yield AuctionMessage(
                     channel=channel,
-                    message=f"Auction Closed. Results: {auction.results}",
+                    content=f"Auction Closed. Results: {auction.results_text}",
                 )
 
             # Check to see if we need to post an update for this auction to the
-            # channel.
-            if auction.needs_update:
-                auction.last_updated = datetime.datetime.utcnow()
+            # channel. An auction that we just closed never needs one, so we don't
+            # bother computing the results a second time for it.
+            elif auction.needs_update:
+                auction.last_updated = _utcnow()
                 results = determine_results(
                     auction, self._dkp, member_treshold=self._limits.member
                 )
+                description, time_left = auction.summary()
                 yield AuctionMessage(
                     channel=channel,
-                    message=(
-                        f"This is an update for {auction.item.description} "
-                        f"ending in {humanize_delta(auction.time_left)}.\n"
+                    content=(
+                        f"This is an update for {description} "
+                        f"ending in {time_left}.\n"
                         f"Results: {results}"
                     ),
                 )
@@ -463,24 +564,30 @@ class Auctioneer:
         valid, error = validate_bid(
             bidder,
             bid_amount,
-            auction.bids,
+            auction.bid_amounts,
             self._dkp,
             valuable_threshold=self._limits.valuable,
             minimum=self._limits.minimum,
             maximum=self._limits.maximum,
         )
         if not valid:
-            yield AuctionMessage(channel=channel, message=error, hidden=True)
+            yield AuctionMessage(channel=channel, content=error, hidden=True)
             return
 
         # Add our bid to the system, extending the time left before the auction
-        # ends if required.
+        # ends if required. If the bidder already has a bid with this id, then we only
+        # replace it if the new bid would rank higher, bidders can't lower their bids.
         bid = Bid(bidder=bidder, bid=bid_amount, id=bid_id, rank=rank)
-        auction.bids.add(bid)
-        auction.last_bid = datetime.datetime.utcnow()
+        existing = auction.bids.setdefault((bidder, bid_id), bid)
+        if existing is not bid:
+            key_fn = _bid_key(self._dkp, self._limits.member)
+            if key_fn(bid) > key_fn(existing):
+                auction.bids[(bidder, bid_id)] = bid
+        auction.bid_amounts.add(bid.bid)
+        auction.last_bid = _utcnow()
 
-        yield AuctionMessage(channel=channel, message="Bid Accepted!", hidden=True)
-        yield AuctionMessage(channel=channel, message=f"{bid.bidder} has bid {bid.bid}")
+        yield AuctionMessage(channel=channel, content="Bid Accepted!", hidden=True)
+        yield AuctionMessage(channel=channel, content=f"{bid.bidder} has bid {bid.bid}")
 
     @check_auction_channels
     @check_auction_status(
@@ -494,11 +601,11 @@ class Auctioneer:
         auction.status = Status.Stopped
 
         yield AuctionMessage(
-            channel=channel, message="Auction has been stopped", hidden=True
+            channel=channel, content="Auction has been stopped", hidden=True
         )
         yield AuctionMessage(
             channel=channel,
-            message=f"Auction for {auction.item.description} has been stopped.",
+            content=f"Auction for {auction.item.description} has been stopped.",
         )
 
     @check_auction_channels
@@ -513,15 +620,21 @@ class Auctioneer:
         auction = typing.cast(RunningAuction, self._channels[channel])
 
         # We're going to compute the results again, and see if they differ, if they
-        # do, we're going to refuse to accept the auction without a -force flag.
-        results = determine_results(
-            auction, self._dkp, member_treshold=self._limits.member
-        )
+        # do, we're going to refuse to accept the auction without a -force flag. If
+        # nothing that the results depend on has changed, we can skip recomputing them.
+        if auction.results_fingerprint == _results_fingerprint(auction, self._dkp):
+            results = auction.results
+            results_text = auction.results_text
+        else:
+            results = determine_results(
+                auction, self._dkp, member_treshold=self._limits.member
+            )
+            results_text = str(results)
         if not force and auction.results != results:
             # TODO: Mention the ability to reopen + force accept the new results.
             yield AuctionMessage(
                 channel=channel,
-                message=(
+                content=(
                     "This auction has not been accepted because the results "
                     "have changed since it closed."
                 ),
@@ -530,10 +643,10 @@ class Auctioneer:
         else:
             # TODO: Award the item in the DKP system.
             yield AuctionMessage(
-                channel=channel, message="Auction Accepted", hidden=True
+                channel=channel, content="Auction Accepted", hidden=True
             )
             yield AuctionMessage(
-                channel=channel, message=f"Auction Accepted: {results}"
+                channel=channel, content=f"Auction Accepted: {results_text}"
             )
 
     @check_auction_channels
@@ -550,18 +663,18 @@ class Auctioneer:
         # auction so it runs for the full duration again, just with the bids in the same
         # state that they are now.
         auction.results = None
-        auction.started_at = datetime.datetime.utcnow()
+        auction.results_fingerprint = None
+        auction.results_text = None
+        auction.started_at = _utcnow()
         auction.last_updated = None
         auction.last_bid = None
         auction.status = Status.Running
 
-        yield AuctionMessage(channel=channel, message="Reopening Bidding", hidden=True)
+        description, time_left = auction.summary()
+        yield AuctionMessage(channel=channel, content="Reopening Bidding", hidden=True)
         yield AuctionMessage(
             channel=channel,
-            message=(
-                f"Reopening Bids for {auction.item.description}, "
-                f"ending in {humanize_delta(auction.time_left)}"
-            ),
+            content=f"Reopening Bids for {description}, ending in {time_left}",
         )
 
     @check_auction_channels
@@ -575,13 +688,11 @@ class Auctioneer:
         auction = RunningAuction(item=item)
         self._channels[channel] = auction
 
-        yield AuctionMessage(channel=channel, message="Restarted Auction", hidden=True)
+        description, time_left = auction.summary()
+        yield AuctionMessage(channel=channel, content="Restarted Auction", hidden=True)
         yield AuctionMessage(
             channel=channel,
-            message=(
-                f"Restarting Bids for {item.description}, "
-                f"ending in {humanize_delta(auction.time_left)}"
-            ),
+            content=f"Restarting Bids for {description}, ending in {time_left}",
         )
 
     @check_auction_channels
@@ -590,30 +701,32 @@ class Auctioneer:
         auction = typing.cast(RunningAuction, self._channels[channel])
 
         self._channels[channel] = None
+        self._mark_idle(channel)
 
-        yield AuctionMessage(channel=channel, message="Auction Deleted", hidden=True)
+        yield AuctionMessage(channel=channel, content="Auction Deleted", hidden=True)
         yield AuctionMessage(
             channel=channel,
-            message=f"Auction for {auction.item.description} has been deleted.",
+            content=f"Auction for {auction.item.description} has been deleted.",
         )
 
     def next(self) -> Iterable[AuctionMessage]:
-        while self._pending_items and not all(self._channels.values()):
+        while self._pending_items and self._idle:
             # If we've gotten here, then we have items to auction, and we have available
             # channels to auction them in, so let's go ahead and pick one of each.
-            item = self._pending_items.pop(0)
-            channel = random.choice(
-                [channel for channel, item in self._channels.items() if item is None]
-            )
+            item = self._pending_items.popleft()
+            channel = self._idle[random.randrange(len(self._idle))]
 
             # We have an item and a channel, now we'll actually start the auction.
             auction = RunningAuction(item=item)
             self._channels[channel] = auction
+            self._mark_active(channel)
+
+            description, time_left = auction.summary()
             yield AuctionMessage(
                 channel=channel,
-                message=(
-                    f"Starting Bid for {item.description} by {item.added_by}, "
-                    f"ending in {humanize_delta(auction.time_left)}"
+                content=(
+                    f"Starting Bid for {description} by {item.added_by}, "
+                    f"ending in {time_left}"
                 ),
             )
 
@@ -632,9 +745,7 @@ def check_roles(*roles: typing.Union[Role, str, int]):
     def deco(fn):
         @functools.wraps(fn)
         async def wrapper(self, ctx: SlashContext, *args, **kwargs):
-            if not set(ctx.author.roles) & {
-                self.get_role(role) for role in roles if role is not None
-            }:
+            if self.get_roles(roles).isdisjoint(ctx.author.roles):
                 await ctx.send(
                     hidden=True,
                     content=(
@@ -658,31 +769,50 @@ class Auction(Cog):
         )
         self.dkp = self.bot.get_cog("DKP")
         self.server = None
+        self._roles_by_name = {}
         self._role_mappings = {}
+        self._role_sets = {}
         self._run_auction.start()
 
     @Cog.listener(name="on_ready")
     async def _on_ready(self):
         self.server = self.bot.get_guild(self.bot.config.discord.server_id)
 
+        # We resolve all of our configured roles up front, so that checking roles for
+        # every command is just a dictionary lookup. If multiple roles share a name,
+        # the first one wins, so we build the name lookup in reverse.
+        self._roles_by_name = {role.name: role for role in reversed(self.server.roles)}
+        self._role_mappings = {role: self._lookup_role(role) for role in Role}
+        self._role_sets = {}
+
+    def _lookup_role(self, role: typing.Union[Role, str, int]):
+        lookup_role = role
+        if isinstance(role, Role):
+            lookup_role = getattr(self.bot.config.auction.roles, role.value)
+
+        if isinstance(lookup_role, str):
+            return self._roles_by_name.get(lookup_role)
+        else:
+            return self.server.get_role(lookup_role)
+
     def get_role(self, role: typing.Union[Role, str, int]):
         if role not in self._role_mappings:
-            lookup_role = role
-            if isinstance(role, Role):
-                lookup_role = getattr(self.bot.config.auction.roles, role.value)
-
-            if isinstance(lookup_role, str):
-                for discord_role in self.server.roles:
-                    if discord_role.name == lookup_role:
-                        self._role_mappings[role] = discord_role
-                        break
-                else:
-                    self._role_mappings[role] = None
-            else:
-                self._role_mappings[role] = self.server.get_role(lookup_role)
+            self._role_mappings[role] = self._lookup_role(role)
 
         return self._role_mappings[role]
 
+    def get_roles(self, roles: tuple[typing.Union[Role, str, int], ...]) -> frozenset:
+        # Commands check against the same set of roles every time they're run, so we
+        # resolve each set once and reuse it until we next resolve our roles.
+        if roles not in self._role_sets:
+            self._role_sets[roles] = frozenset(
+                resolved
+                for resolved in (self.get_role(r) for r in roles if r is not None)
+                if resolved is not None
+            )
+
+        return self._role_sets[roles]
+
     async def add_auction_item(self, item, quantity, added_by):
         # TODO: Fetch Item data
         # TODO: Add ACL
@@ -727,10 +857,9 @@ class Auction(Cog):
                 ),
             )
         else:
-            for message in self.auctioneer.bid(
-                ctx.channel.name, character, bid, id_, rank
-            ):
-                await smart_send(ctx, hidden=message.hidden, **message.as_kwargs())
+            await send_messages(
+                ctx, self.auctioneer.bid(ctx.channel.name, character, bid, id_, rank)
+            )
 
     @cog_ext.cog_slash(
         name="bid",
@@ -752,13 +881,14 @@ class Auction(Cog):
     )
     @check_roles(Role.Officer, Role.Raider, Role.Recruit, Role.Member)
     async def _bid(self, ctx: SlashContext, bid: int, id_: int = 0):
-        await ctx.defer(hidden=True)
+        await defer_hidden(ctx)
 
-        if self.get_role(Role.Recruit) in ctx.author.roles:
+        author_roles = frozenset(ctx.author.roles)
+        if self.get_role(Role.Recruit) in author_roles:
             rank = BidderRank.Recruit
-        elif self.get_role(Role.Raider) in ctx.author.roles:
+        elif self.get_role(Role.Raider) in author_roles:
             rank = BidderRank.Raider
-        elif self.get_role(Role.Member) in ctx.author.roles:
+        elif self.get_role(Role.Member) in author_roles:
             rank = BidderRank.Member
         else:
             await ctx.send(
@@ -789,7 +919,7 @@ class Auction(Cog):
     )
     @check_roles(Role.Officer, Role.Raider, Role.Recruit, Role.Member)
     async def _bidalt(self, ctx: SlashContext, bid: int, id_: int = 0):
-        await ctx.defer(hidden=True)
+        await defer_hidden(ctx)
         await self._do_bid(ctx, bid, BidderRank.Alt, id_)
 
     @cog_ext.cog_subcommand(
@@ -797,10 +927,9 @@ class Auction(Cog):
     )
     @check_roles(Role.Officer)
     async def _auction_stop(self, ctx: SlashContext):
-        await ctx.defer(hidden=True)
+        await defer_hidden(ctx)
 
-        for message in self.auctioneer.stop(ctx.channel.name):
-            await smart_send(ctx, hidden=message.hidden, **message.as_kwargs())
+        await send_messages(ctx, self.auctioneer.stop(ctx.channel.name))
 
     @cog_ext.cog_subcommand(
         base="auction",
@@ -818,10 +947,11 @@ class Auction(Cog):
     )
     @check_roles(Role.Officer)
     async def _auction_accept(self, ctx: SlashContext, force: str = "no"):
-        await ctx.defer(hidden=True)
+        await defer_hidden(ctx)
 
-        for message in self.auctioneer.accept(ctx.channel.name, force=force == "yes"):
-            await smart_send(ctx, hidden=message.hidden, **message.as_kwargs())
+        await send_messages(
+            ctx, self.auctioneer.accept(ctx.channel.name, force=force == "yes")
+        )
 
     @cog_ext.cog_subcommand(
         base="auction",
@@ -830,20 +960,18 @@ class Auction(Cog):
     )
     @check_roles(Role.Officer)
     async def _auction_reopen(self, ctx: SlashContext):
-        await ctx.defer(hidden=True)
+        await defer_hidden(ctx)
 
-        for message in self.auctioneer.reopen(ctx.channel.name):
-            await smart_send(ctx, hidden=message.hidden, **message.as_kwargs())
+        await send_messages(ctx, self.auctioneer.reopen(ctx.channel.name))
 
     @cog_ext.cog_subcommand(
         base="auction", name="delete", description="Delete an auction"
     )
     @check_roles(Role.Officer)
     async def _auction_delete(self, ctx: SlashContext):
-        await ctx.defer(hidden=True)
+        await defer_hidden(ctx)
 
-        for message in self.auctioneer.delete(ctx.channel.name):
-            await smart_send(ctx, hidden=message.hidden, **message.as_kwargs())
+        await send_messages(ctx, self.auctioneer.delete(ctx.channel.name))
 
     @cog_ext.cog_subcommand(
         base="auction",
@@ -854,7 +982,6 @@ class Auction(Cog):
     )
     @check_roles(Role.Officer)
     async def _auction_restart(self, ctx: SlashContext):
-        await ctx.defer(hidden=True)
+        await defer_hidden(ctx)
 
-        for message in self.auctioneer.restart(ctx.channel.name):
-            await smart_send(ctx, hidden=message.hidden, **message.as_kwargs())
+        await send_messages(ctx, self.auctioneer.restart(ctx.channel.name))
@@ -52,6 +52,14 @@ class DKP(Cog):
         self.bot = bot
         self.provider = DKPProvider(self.bot.config.dkp)
 
+    async def close(self):
+        await self.provider.close()
+
+    def cog_unload(self):
+        # If we're unloaded while the bot keeps running, we can't wait for this, but
+        # the loop will get to it. When the bot shuts down, close() has already run.
+        self.bot.loop.create_task(self.provider.close())
+
     async def get_dkp(self) -> typing.Mapping[str, CharacterDKP]:
         return await self.provider.list_dkp()
 
@@ -7,7 +7,7 @@ import attr
 from sqlalchemy import Table, Column, Integer, String, DateTime, sql
 from sqlalchemy.ext.asyncio import create_async_engine
 
-from comrade.core import DKP as DKPConfig
+from comrade.core import DKP as DKPConfig, async_database_url
 
 
 @attr.s(slots=True, frozen=True, auto_attribs=True)
@@ -23,7 +23,31 @@ class CharacterDKP:
 class DKPProvider:
     def __init__(self, config: DKPConfig):
         self.config = config
-        self.db = create_async_engine(self.config.database, echo=True)
+        self.db = create_async_engine(
+            async_database_url(self.config.database), echo=True
+        )
+
+        # The last set of points that we fetched, along with the validators that the
+        # server gave us for them, so that we can ask it whether they've changed.
+        self._points: typing.Optional[typing.Mapping[str, CharacterDKP]] = None
+        self._etag: typing.Optional[str] = None
+        self._last_modified: typing.Optional[str] = None
+
+        # We keep a single session around for all of our requests, so that we can
+        # reuse its connections rather than setting up a new one every time. It gets
+        # created lazily, since it needs to be created from within the event loop.
+        self._session: typing.Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def list_dkp(self) -> typing.Mapping[str, CharacterDKP]:
         url = "?".join(
@@ -33,16 +57,28 @@ class DKPProvider:
             ]
         )
 
-        # TODO: This shoudl have a persistent session, not throwing one away every
-        #       time.
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                data = await resp.json()
+        headers = {}
+        if self._points is not None:
+            if self._etag is not None:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified is not None:
+                headers["If-Modified-Since"] = self._last_modified
+
+        async with self.session.get(url, headers=headers) as resp:
+            # If the points haven't changed since the last time we fetched them,
+            # then we can just return the exact same mapping that we did then.
+            if resp.status == 304 and self._points is not None:
+                return self._points
+
+            data = await resp.json()
+            status = resp.status
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
 
         # The EQDKP data structure is kinda wonky and weird, we're going to massage
         # it into something that works better for us.
         pool_name = f"multidkp_points:{self.config.dkp_pool_id}"
-        return {
+        self._points = {
             p["name"].lower(): CharacterDKP(
                 name=p["name"].lower(),
                 current=int(p["points"][pool_name]["points_current"]),
@@ -54,5 +90,15 @@ class DKPProvider:
             if p["active"] == "1" and not p["hidden"]
         }
 
+        # We only hold onto the validators once we've successfully built the points
+        # that they describe, otherwise a failure above would leave us with new
+        # validators and old points, which the server would then tell us are current.
+        if status == 200:
+            self._etag, self._last_modified = etag, last_modified
+        else:
+            self._etag = self._last_modified = None
+
+        return self._points
+
     async def current_dkp(self, character: str) -> typing.Optional[CharacterDKP]:
         return (await self.list_dkp()).get(character.lower(), None)
@@ -29,6 +29,20 @@ class Auction(auction_pb2_grpc.AuctionServicer):
 
         return auction_pb2.AddItemResponse()
 
+    async def AddItems(self, request_iterator, context):
+        # This is the same as AddItem, but lets a client send a whole batch of items
+        # over a single call instead of paying for a round trip per item.
+        auction = self.bot.get_cog("Auction")
+        async for request in request_iterator:
+            if auction is None:
+                logger.warn(f"No auction cog found, discarding item: {request.item}")
+            else:
+                await auction.add_auction_item(
+                    request.item, request.quantity, request.added_by
+                )
+
+        return auction_pb2.AddItemResponse()
+
 
 def AuctionService(*args, **kwargs):
     return (
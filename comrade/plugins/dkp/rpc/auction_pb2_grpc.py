@@ -21,6 +21,11 @@ class AuctionStub(object):
             request_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemRequest.SerializeToString,
             response_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemResponse.FromString,
         )
+        self.AddItems = channel.stream_unary(
+            "/auction.Auction/AddItems",
+            request_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemRequest.SerializeToString,
+            response_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemResponse.FromString,
+        )
 
 
 class AuctionServicer(object):
@@ -32,6 +37,12 @@ class AuctionServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def AddItems(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_AuctionServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -40,6 +51,11 @@ def add_AuctionServicer_to_server(servicer, server):
             request_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemRequest.FromString,
             response_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemResponse.SerializeToString,
         ),
+        "AddItems": grpc.stream_unary_rpc_method_handler(
+            servicer.AddItems,
+            request_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemRequest.FromString,
+            response_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemResponse.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "auction.Auction", rpc_method_handlers
@@ -79,3 +95,32 @@ class Auction(object):
             timeout,
             metadata,
         )
+
+    @staticmethod
+    def AddItems(
+        request_iterator,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            "/auction.Auction/AddItems",
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemRequest.SerializeToString,
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )